@@ -5,26 +5,30 @@ import random
 import json
 import time
 import os
-from urllib.request import urlopen, Request
+from concurrent.futures import ThreadPoolExecutor
 import plotly.graph_objects as go
-from scipy.spatial import KDTree
+from plotly.colors import qualitative
+from scipy.spatial import cKDTree
 
 # --- 1. CRITICAL: PRE-FLIGHT DATA RECOVERY (Anti-Flicker Fix) ---
 # Check for existing game state BEFORE any UI logic runs to prevent the "No Game Found" flicker.
 AUTOSAVE_FILE = "saved/.imperialism_autosave.json"
 
 def load_autosave_silent():
+    # Returns the per-county owners older saves stored, so startup can seed the map from them
     if os.path.exists(AUTOSAVE_FILE):
         try:
             with open(AUTOSAVE_FILE, "r") as f:
                 data = json.load(f)
+                legacy_assignments = data.pop('county_assignments', None)
                 for k, v in data.items():
                     if k not in st.session_state:
                         st.session_state[k] = v
+                return legacy_assignments
         except:
             pass
 
-load_autosave_silent()
+legacy_assignments = load_autosave_silent()
 
 # --- CONFIG & SETUP ---
 st.set_page_config(page_title="Madden Imperialism Engine", layout="wide")
@@ -91,6 +95,32 @@ st.markdown("""
         letter-spacing: 1px;
     }
 
+    /* Slot-machine reel: a column of badges scrolled one badge per step, stopping on the last */
+    .reel {
+        display: inline-block;
+        height: 32px;
+        overflow: hidden;
+        vertical-align: middle;
+    }
+
+    .reel-strip {
+        display: flex;
+        flex-direction: column;
+        align-items: center;
+        animation-name: reel-spin;
+        animation-fill-mode: both;
+    }
+
+    .reel-strip .vs-badge {
+        height: 32px;
+        line-height: 22px;
+        box-sizing: border-box;
+    }
+
+    @keyframes reel-spin {
+        to { transform: translateY(calc(-100% + 32px)); }
+    }
+
     .spinning-text {
         color: #d4a017;
         font-style: italic;
@@ -102,6 +132,28 @@ st.markdown("""
     @keyframes blinker {
         50% { opacity: 0; }
     }
+
+    /* Both spin status lines share one cell; the second takes over when the attacker reel stops */
+    .spin-status {
+        display: grid;
+    }
+
+    .spin-status > div {
+        grid-area: 1 / 1;
+        animation-name: blinker, spin-phase;
+        animation-duration: 0.2s, 0s;
+        animation-timing-function: linear;
+        animation-iteration-count: infinite, 1;
+        animation-fill-mode: none, forwards;
+    }
+
+    @keyframes spin-phase {
+        to { visibility: hidden; }
+    }
+
+    @keyframes spin-phase-in {
+        to { visibility: visible; }
+    }
     </style>
     """, unsafe_allow_html=True)
 
@@ -109,14 +161,20 @@ st.markdown("""
 COUNTY_GEOJSON_URL = "https://raw.githubusercontent.com/plotly/datasets/master/geojson-counties-fips.json"
 CENSUS_CENTER_URL = "https://www2.census.gov/geo/docs/reference/cenpop2020/county/CenPop2020_Mean_CO.txt"
 ADJACENCY_URL = "https://www2.census.gov/geo/docs/reference/county_adjacency.txt"
+ATTACKER_REEL_SECS = 1.2
+DEFENDER_REEL_SECS = 1.0
+KD_TREE_MIN_TEAMS = 64  # From this many teams, a KD-tree beats a dense distance scan
+TEAM_PALETTE = qualitative.Dark24 + qualitative.Light24  # Fallback colors for rosters without a Color column
 
 # --- STATE INITIALIZATION ---
 def init_state():
     defaults = {
         'game_active': False,
         'teams': [],
-        'county_assignments': {},
-        'adjacencies': {},
+        'owners': None,
+        'initial_owners': None,
+        'team_ids': {},
+        'team_colors': {},
         'battle_log': [],
         'is_replaying': False,
         'trigger_replay': False,
@@ -133,7 +191,6 @@ def save_game_state():
     """Serializes current state to a local JSON file."""
     state = {
         "teams": st.session_state.teams,
-        "county_assignments": st.session_state.county_assignments,
         "battle_log": st.session_state.battle_log,
         "last_header_content": st.session_state.last_header_content,
         "game_active": st.session_state.game_active
@@ -141,41 +198,94 @@ def save_game_state():
     with open(AUTOSAVE_FILE, "w") as f:
         json.dump(state, f)
 
-@st.cache_data
+# Persisted to disk so container restarts don't re-download the Census files.
+# Failures raise instead of returning, so a network hiccup is never cached.
+@st.cache_data(persist="disk")
+def fetch_map_resources():
+    geojson_ref = COUNTY_GEOJSON_URL
+
+    # Both Census files download concurrently; a failure in either is re-raised by result()
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        census_job = pool.submit(
+            pd.read_csv, CENSUS_CENTER_URL,
+            usecols=['STATEFP', 'COUNTYFP', 'COUNAME', 'LATITUDE', 'LONGITUDE'],
+            dtype={'STATEFP': str, 'COUNTYFP': str, 'LATITUDE': np.float64, 'LONGITUDE': np.float64}
+        )
+        adj_job = pool.submit(
+            pd.read_csv, ADJACENCY_URL, sep='\t', header=None, usecols=[1, 3], names=['cfips', 'nfips'],
+            dtype=str, encoding='latin-1'
+        )
+        df, adj = census_job.result(), adj_job.result()
+
+    df['fips'] = df['STATEFP'].str.zfill(2) + df['COUNTYFP'].str.zfill(3)
+    counties_df = df[['fips', 'COUNAME', 'LATITUDE', 'LONGITUDE']].rename(columns={'LATITUDE':'lat', 'LONGITUDE':'lon', 'COUNAME':'name'})
+
+    # Only the first row of each county block carries its FIPS; the rest inherit it
+    adj['cfips'] = adj['cfips'].ffill().str.strip().str.zfill(5)
+    adj['nfips'] = adj['nfips'].str.strip().str.zfill(5)
+    counties_df = counties_df.dropna().reset_index(drop=True)
+
+    # Map both ends to counties_df row positions so edges can index the owners array directly
+    fips_index = pd.Index(counties_df['fips'])
+    adj_edges = np.column_stack([
+        fips_index.get_indexer(adj['cfips']),
+        fips_index.get_indexer(adj['nfips'])
+    ]).astype(np.int32)
+    adj_edges = adj_edges[(adj_edges >= 0).all(axis=1) & (adj_edges[:, 0] != adj_edges[:, 1])]
+    # float32 keeps ~1m precision on degrees and halves the memory the distance scan streams through
+    county_xy = np.ascontiguousarray(counties_df[['lat', 'lon']].to_numpy(dtype=np.float32))
+    return geojson_ref, counties_df, county_xy, adj_edges
+
+# Shared by reference across reruns and sessions, so a rerun skips unpickling the cached data.
+# The arrays are frozen because every session reads the same copy.
+@st.cache_resource
+def shared_map_resources():
+    geojson_ref, counties_df, county_xy, adj_edges = fetch_map_resources()
+    county_fips = counties_df['fips'].to_numpy()
+    for arr in (county_fips, county_xy, adj_edges):
+        arr.setflags(write=False)
+    return geojson_ref, county_fips, county_xy, adj_edges
+
 def load_map_resources():
     try:
-        geojson_ref = COUNTY_GEOJSON_URL
-
-        df = pd.read_csv(CENSUS_CENTER_URL, dtype={'STATEFP': str, 'COUNTYFP': str})
-        df['fips'] = df['STATEFP'].str.zfill(2) + df['COUNTYFP'].str.zfill(3)
-        counties_df = df[['fips', 'COUNAME', 'LATITUDE', 'LONGITUDE']].rename(columns={'LATITUDE':'lat', 'LONGITUDE':'lon', 'COUNAME':'name'})
-
-        adj_dict = {}
-        response = urlopen(ADJACENCY_URL)
-        current_county = None
-        for line in response:
-            line_str = line.decode('latin-1').strip()
-            if not line_str: continue
-            parts = line_str.split('\t')
-            if len(parts) >= 4:
-                if parts[1].strip():
-                    current_county = parts[1].strip().zfill(5)
-                    if current_county not in adj_dict: adj_dict[current_county] = []
-                neighbor_fips = parts[3].strip().zfill(5)
-                if current_county and neighbor_fips != current_county:
-                    adj_dict[current_county].append(neighbor_fips)
-        return geojson_ref, counties_df.dropna(), adj_dict
+        return shared_map_resources()
     except Exception as e:
         st.error(f"Failed to load resources: {e}")
-        return None, None, None
-
-def assign_initial_territories(teams, counties_df):
-    if not teams: return {}
-    team_coords = np.array([[t['lat'], t['lon']] for t in teams])
-    county_coords = counties_df[['lat', 'lon']].values
-    tree = KDTree(team_coords)
-    _, indices = tree.query(county_coords)
-    return {counties_df.iloc[i]['fips']: teams[team_idx]['name'] for i, team_idx in enumerate(indices)}
+        return None, None, None, None
+
+@st.cache_resource
+def get_team_tree(team_coords):
+    # Keyed by the (lat, lon) tuples so replays and reloads reuse the same tree
+    return cKDTree(np.array(team_coords), balanced_tree=False, compact_nodes=False)
+
+def index_teams(teams):
+    # Name lookups are rebuilt only when the roster is replaced, not on every rerun
+    st.session_state.team_ids = {t['name']: i for i, t in enumerate(teams)}
+    st.session_state.team_colors = {t['name']: t['color'] for t in teams}
+
+def assign_initial_territories(teams, county_xy):
+    # Returns the owning team's index for every county, aligned with counties_df rows
+    if not teams: return np.full(len(county_xy), -1, dtype=np.int16)
+    team_coords = tuple((t['lat'], t['lon']) for t in teams)
+    if len(teams) < KD_TREE_MIN_TEAMS:
+        # Centroids are stored as float32; distances are taken in float64 so near-ties resolve as before
+        diff = county_xy[:, None, :].astype(np.float64) - np.array(team_coords)[None, :, :]
+        indices = np.einsum('ijk,ijk->ij', diff, diff).argmin(axis=1)
+    else:
+        _, indices = get_team_tree(team_coords).query(county_xy, workers=-1)
+    # Duplicate names share one id (the last, as in team_ids) so later conquests move all of their counties
+    ids = {t['name']: i for i, t in enumerate(teams)}
+    return np.array([ids[t['name']] for t in teams], dtype=np.int16)[indices]
+
+def rebuild_owners(initial_owners, battle_log, team_ids, num_teams):
+    # Conquests are replayed on the per-team map (initial owner -> current owner), then applied to every county once
+    team_map = np.arange(num_teams, dtype=np.int16)
+    for battle in battle_log:
+        winner = battle.get('winner')
+        if winner:
+            loser = battle['def'] if winner == battle['att'] else battle['att']
+            team_map[team_map == team_ids[loser]] = team_ids[winner]
+    return team_map[initial_owners]
 
 def hex_to_rgba(hex_color, alpha):
     hex_color = hex_color.lstrip('#')
@@ -183,42 +293,34 @@ def hex_to_rgba(hex_color, alpha):
     rgb = tuple(int(hex_color[i:i + lv // 3], 16) for i in range(0, lv, lv // 3))
     return f'rgba({rgb[0]}, {rgb[1]}, {rgb[2]}, {alpha})'
 
-def render_map(geojson, county_assignments, teams_list, highlight_teams=None):
-    # FIXED: We use the master teams_list (all 32 teams) to define the color range
+def team_colorscale(teams_list, highlight_teams=None):
+    num_teams = len(teams_list)
+    highlight = frozenset(highlight_teams or ())
+    return [
+        [i / max(1, num_teams - 1), hex_to_rgba(t['color'], 1.0 if not highlight or t['name'] in highlight else 0.15)]
+        for i, t in enumerate(teams_list)
+    ]
+
+# Reruns that don't change ownership (radio clicks, sidebar, spin) reuse the built figure.
+# st.plotly_chart only reads the figure, so it is safe to share by reference.
+# _county_fips is fixed per process and is an object array (hashed by pointer), so it is left out of the key.
+@st.cache_resource(max_entries=32)
+def render_map(geojson, _county_fips, owners, teams_list, highlight_teams=None):
+    # FIXED: Owners are indices into the master teams_list (all 32 teams), which defines the color range
     # This ensures "Team X" always has the same index and thus the same color.
-    team_to_id = {t['name']: i for i, t in enumerate(teams_list)}
     num_teams = len(teams_list)
-
-    fips_list = list(county_assignments.keys())
-    owners_list = list(county_assignments.values())
-
-    z_vals = [team_to_id.get(name, 0) for name in owners_list]
-
-    colorscale = []
-    for i, t in enumerate(teams_list):
-        scale_val = i / (max(1, num_teams - 1)) if num_teams > 1 else 0
-        base_color = t['color']
-
-        if highlight_teams:
-            if t['name'] in highlight_teams:
-                color = hex_to_rgba(base_color, 1.0)
-            else:
-                color = hex_to_rgba(base_color, 0.15)
-        else:
-            color = hex_to_rgba(base_color, 1.0)
-
-        colorscale.append([scale_val, color])
+    team_names = np.array([t['name'] for t in teams_list], dtype=object)
 
     fig = go.Figure(go.Choropleth(
         geojson=geojson,
-        locations=fips_list,
-        z=z_vals,
-        colorscale=colorscale,
+        locations=_county_fips,
+        z=owners,
+        colorscale=team_colorscale(teams_list, highlight_teams),
         showscale=False,
         marker_line_width=0,
         zmin=0,                  # FIXED: Anchor the range
         zmax=num_teams - 1,      # FIXED: Anchor the range
-        text=owners_list,
+        text=team_names[owners],
         hoverinfo="text"
     ))
 
@@ -235,20 +337,28 @@ def render_map(geojson, county_assignments, teams_list, highlight_teams=None):
     )
     return fig
 
-def get_neighbors(team_name):
-    team_counties = [fips for fips, owner in st.session_state.county_assignments.items() if owner == team_name]
-    neighbors = set()
-    for fips in team_counties:
-        if fips in st.session_state.adjacencies:
-            for adj_fips in st.session_state.adjacencies[fips]:
-                neighbor_owner = st.session_state.county_assignments.get(adj_fips)
-                if neighbor_owner and neighbor_owner != team_name:
-                    neighbors.add(neighbor_owner)
-    return list(neighbors)
-
-def format_battle_header(att, dfn, winner=None, label="BATTLE", spinning=False, spin_target="ALL"):
-    att_c = next((t['color'] for t in st.session_state.teams if t['name'] == att), "#555")
-    dfn_c = next((t['color'] for t in st.session_state.teams if t['name'] == dfn), "#555")
+def get_neighbors(adj_edges):
+    # One pass over every county border: each distinct (owner, neighbor owner) pair is a rivalry
+    edge_owners = st.session_state.owners[adj_edges]
+    edge_owners = edge_owners[edge_owners[:, 0] != edge_owners[:, 1]]
+    team_names = [t['name'] for t in st.session_state.teams]
+    neighbors = {}
+    for team_id, rival_id in np.unique(edge_owners, axis=0).tolist():
+        if team_names[team_id] != team_names[rival_id]:
+            neighbors.setdefault(team_names[team_id], []).append(team_names[rival_id])
+    return neighbors
+
+def reel_badge(names, duration, delay=0.0):
+    colors = st.session_state.team_colors
+    strip = "".join(f"<span class='vs-badge' style='background:{colors.get(n, '#555')};'>{n}</span>" for n in names)
+    timing = f"animation-duration: {duration}s; animation-delay: {delay}s; animation-timing-function: steps({len(names) - 1}, end);"
+    return f"<span class='reel'><span class='reel-strip' style='{timing}'>{strip}</span></span>"
+
+def format_battle_header(att, dfn, winner=None, label="BATTLE", reels=None):
+    att_c = st.session_state.team_colors.get(att, "#555")
+    dfn_c = st.session_state.team_colors.get(dfn, "#555")
+    att_badge = f"<span class='vs-badge' style='background:{att_c};'>{att}</span>"
+    dfn_badge = f"<span class='vs-badge' style='background:{dfn_c};'>{dfn}</span>"
 
     header_style = "background-color: #f8f9fa; color: #333;"
     status_html = ""
@@ -257,13 +367,16 @@ def format_battle_header(att, dfn, winner=None, label="BATTLE", spinning=False,
         win_c = att_c if winner == att else dfn_c
         header_style = f"background-color: {win_c}; color: white; border: none;"
         status_html = f"<div class='winner-status'>🏆 {winner} WINS!</div>"
-    elif spinning:
-        if spin_target == "ATTACKER":
-            status_html = "<div class='spinning-text'>🎰 SELECTING ATTACKER...</div>"
-        elif spin_target == "DEFENDER":
-            status_html = "<div class='spinning-text'>🎰 SELECTING DEFENDER...</div>"
-        else:
-            status_html = "<div class='spinning-text'>🎰 SPINNING...</div>"
+    elif reels:
+        # The browser plays the spin; the defender reel starts once the attacker reel stops
+        att_badge = reel_badge(reels[0], ATTACKER_REEL_SECS)
+        dfn_badge = reel_badge(reels[1], DEFENDER_REEL_SECS, delay=ATTACKER_REEL_SECS)
+        status_html = f"""
+            <div class='spin-status'>
+                <div class='spinning-text' style='animation-delay: 0s, {ATTACKER_REEL_SECS}s;'>🎰 SELECTING ATTACKER...</div>
+                <div class='spinning-text' style='visibility: hidden; animation-name: blinker, spin-phase-in; animation-delay: 0s, {ATTACKER_REEL_SECS}s;'>🎰 SELECTING DEFENDER...</div>
+            </div>
+        """
     else:
         status_html = "<div class='winner-status' style='color:#777; font-size: 0.8em;'>Awaiting Outcome...</div>"
 
@@ -271,18 +384,37 @@ def format_battle_header(att, dfn, winner=None, label="BATTLE", spinning=False,
         <div class='replay-header' style='{header_style}'>
             <div style='font-size: 0.6em; opacity: 0.7; letter-spacing: 1px;'>{label}</div>
             <div style='margin-top: 2px;'>
-                <span class='vs-badge' style='background:{att_c};'>{att}</span>
+                {att_badge}
                 <b style='font-size: 1.0em;'>-</b>
-                <span class='vs-badge' style='background:{dfn_c};'>{dfn}</span>
+                {dfn_badge}
             </div>
             {status_html}
         </div>
     """
 
 # --- AUTO-LOAD ON STARTUP ---
-geojson, counties_df, adj_dict = load_map_resources()
-if adj_dict:
-    st.session_state.adjacencies = adj_dict
+# Warm reruns return from cache instantly; a cold start shows progress instead of a blank page
+with st.spinner("Loading county map data...", show_time=True):
+    geojson, county_fips, county_xy, adj_edges = load_map_resources()
+
+if st.session_state.teams and not (st.session_state.team_ids and st.session_state.team_colors):
+    index_teams(st.session_state.teams)
+
+# The autosave only journals teams and battles; county ownership is derived from them.
+# The starting map is kept for the session so replays and rebuilds don't re-run the assignment.
+if st.session_state.game_active and county_xy is not None:
+    if st.session_state.initial_owners is None:
+        st.session_state.initial_owners = assign_initial_territories(st.session_state.teams, county_xy)
+    if st.session_state.owners is None:
+        # A legacy save's county owners are used as-is when every county maps to a known team
+        seeded = pd.Series(county_fips).map(legacy_assignments or {}).map(st.session_state.team_ids)
+        if seeded.notna().all():
+            st.session_state.owners = seeded.to_numpy(dtype=np.int16)
+        else:
+            st.session_state.owners = rebuild_owners(
+                st.session_state.initial_owners, st.session_state.battle_log,
+                st.session_state.team_ids, len(st.session_state.teams)
+            )
 
 active_battle = None
 if st.session_state.battle_log and st.session_state.battle_log[-1].get('winner') is None:
@@ -326,7 +458,9 @@ if not st.session_state.game_active:
             data = json.load(uploaded_file)
             st.session_state.teams = data["teams"]
             st.session_state.battle_log = data.get("history", [])
-            st.session_state.county_assignments = assign_initial_territories(st.session_state.teams, counties_df)
+            index_teams(st.session_state.teams)
+            st.session_state.initial_owners = assign_initial_territories(st.session_state.teams, county_xy)
+            st.session_state.owners = st.session_state.initial_owners.copy()
             st.session_state.trigger_replay = True
             st.session_state.game_active = True
             setup_ui_container.empty()
@@ -343,12 +477,15 @@ if not st.session_state.game_active:
             st.warning("No default team CSV found. Please ensure `nfl_teams.csv` exists.")
 
         if st.button("🚀 Start New NFL Imperialism", disabled=(valid_path is None)):
-            new_teams = [
-                {"name": r['Team'], "lat": r['Latitude'], "lon": r['Longitude'], "color": r.get('Color', "#%06x" % random.randint(0, 0xFFFFFF)), "active": True}
-                for _, r in pd.read_csv(valid_path).iterrows()
-            ]
+            roster = pd.read_csv(valid_path).rename(columns={'Team': 'name', 'Latitude': 'lat', 'Longitude': 'lon', 'Color': 'color'})
+            if 'color' not in roster:
+                roster['color'] = [TEAM_PALETTE[i % len(TEAM_PALETTE)] for i in range(len(roster))]
+            roster['active'] = True
+            new_teams = roster[['name', 'lat', 'lon', 'color', 'active']].to_dict('records')
             st.session_state.teams = new_teams
-            st.session_state.county_assignments = assign_initial_territories(new_teams, counties_df)
+            index_teams(new_teams)
+            st.session_state.initial_owners = assign_initial_territories(new_teams, county_xy)
+            st.session_state.owners = st.session_state.initial_owners.copy()
             st.session_state.battle_log = []
             st.session_state.last_header_content = "<div class='replay-header'><h2>Initial Territories</h2></div>"
             st.session_state.game_active = True
@@ -372,7 +509,7 @@ if st.session_state.game_active:
             header_placeholder.markdown(f"<div class='header-container'>{st.session_state.last_header_content}</div>", unsafe_allow_html=True)
             current_highlight = [active_battle['att'], active_battle['def']] if active_battle else None
             map_placeholder.plotly_chart(
-                render_map(geojson, st.session_state.county_assignments, st.session_state.teams, highlight_teams=current_highlight),
+                render_map(geojson, county_fips, st.session_state.owners, st.session_state.teams, highlight_teams=current_highlight),
                 use_container_width=True, key="main_map", config={'displayModeBar': False}
             )
 
@@ -382,10 +519,14 @@ if st.session_state.game_active:
         if st.button("⏪ Replay All Battles", disabled=st.session_state.is_replaying) or st.session_state.trigger_replay:
             st.session_state.trigger_replay = False
             st.session_state.is_replaying = True
-            cur_map = assign_initial_territories(st.session_state.teams, counties_df)
+            team_ids = st.session_state.team_ids
+            team_names = np.array([t['name'] for t in st.session_state.teams], dtype=object)
+            cur_map = st.session_state.initial_owners.copy()
 
+            # One private copy of the figure is patched per step, so replays don't churn the render_map cache
+            replay_fig = go.Figure(render_map(geojson, county_fips, cur_map, st.session_state.teams))
             header_placeholder.markdown("<div class='header-container'><div class='replay-header'><h2>Initial Territories</h2></div></div>", unsafe_allow_html=True)
-            map_placeholder.plotly_chart(render_map(geojson, cur_map, st.session_state.teams), use_container_width=True, key="replay_start")
+            map_placeholder.plotly_chart(replay_fig, use_container_width=True, key="replay_start")
             time.sleep(2.0)
 
             completed_battles = [b for b in st.session_state.battle_log if b.get('winner')]
@@ -394,19 +535,19 @@ if st.session_state.game_active:
                 loser = dfn if win == att else att
 
                 # MATCHUP PHASE
-                matchup_fig = render_map(geojson, cur_map, st.session_state.teams, [att, dfn])
+                replay_fig.update_traces(colorscale=team_colorscale(st.session_state.teams, [att, dfn]))
                 current_header = format_battle_header(att, dfn, label=f'BATTLE {i+1}')
 
-                map_placeholder.plotly_chart(matchup_fig, use_container_width=True, key=f"replay_m_{i}", config={'displayModeBar': False})
+                map_placeholder.plotly_chart(replay_fig, use_container_width=True, key=f"replay_m_{i}", config={'displayModeBar': False})
                 header_placeholder.markdown(f"<div class='header-container'>{current_header}</div>", unsafe_allow_html=True)
                 time.sleep(1.2)
 
                 # WINNER PHASE
-                cur_map = {f: (win if o == loser else o) for f, o in cur_map.items()}
-                winner_fig = render_map(geojson, cur_map, st.session_state.teams, [att, dfn])
+                cur_map[cur_map == team_ids[loser]] = team_ids[win]
+                replay_fig.update_traces(z=cur_map, text=team_names[cur_map])
                 winner_header = format_battle_header(att, dfn, win, label=f'BATTLE {i+1}')
 
-                map_placeholder.plotly_chart(winner_fig, use_container_width=True, key=f"replay_w_{i}", config={'displayModeBar': False})
+                map_placeholder.plotly_chart(replay_fig, use_container_width=True, key=f"replay_w_{i}", config={'displayModeBar': False})
                 header_placeholder.markdown(f"<div class='header-container'>{winner_header}</div>", unsafe_allow_html=True)
 
                 if i == len(completed_battles) - 1:
@@ -415,7 +556,7 @@ if st.session_state.game_active:
                 time.sleep(1.0)
 
             time.sleep(1.0)
-            st.session_state.county_assignments = cur_map
+            st.session_state.owners = cur_map
             st.session_state.is_replaying = False
             save_game_state()
             st.rerun()
@@ -429,32 +570,33 @@ if st.session_state.game_active:
                 st.session_state.battle_log[-1]['winner'] = winner
                 loser = active_battle['def'] if winner == active_battle['att'] else active_battle['att']
 
-                st.session_state.county_assignments = {f: (winner if o == loser else o) for f, o in st.session_state.county_assignments.items()}
-                for t in st.session_state.teams:
-                    t['active'] = t['name'] in set(st.session_state.county_assignments.values())
+                owners = st.session_state.owners
+                team_ids = st.session_state.team_ids
+                owners[owners == team_ids[loser]] = team_ids[winner]
+                alive = np.bincount(owners, minlength=len(st.session_state.teams)) > 0
+                for t, is_alive in zip(st.session_state.teams, alive.tolist()):
+                    t['active'] = is_alive
 
                 st.session_state.last_header_content = format_battle_header(active_battle['att'], active_battle['def'], winner)
                 save_game_state()
                 st.rerun()
         else:
             if st.button("🎰 SPIN FOR NEXT BATTLE", use_container_width=True, type="primary", disabled=st.session_state.is_replaying):
-                viable_attackers = [t for t in active_teams if get_neighbors(t['name'])]
+                neighbors = get_neighbors(adj_edges)
+                viable_attackers = [t for t in active_teams if t['name'] in neighbors]
                 if viable_attackers:
-                    for i in range(12):
-                        temp_att = random.choice(viable_attackers)
-                        header_placeholder.markdown(f"<div class='header-container'>{format_battle_header(temp_att['name'], '?', spinning=True, spin_target='ATTACKER')}</div>", unsafe_allow_html=True)
-                        time.sleep(0.1)
-
                     final_attacker = random.choice(viable_attackers)['name']
-                    valid_neighbors = get_neighbors(final_attacker)
-
-                    for i in range(10):
-                        temp_dfn = random.choice(valid_neighbors)
-                        header_placeholder.markdown(f"<div class='header-container'>{format_battle_header(final_attacker, temp_dfn, spinning=True, spin_target='DEFENDER')}</div>", unsafe_allow_html=True)
-                        time.sleep(0.1)
-
+                    valid_neighbors = neighbors[final_attacker]
                     final_defender = random.choice(valid_neighbors)
 
+                    # One header push with decoy names; the browser animates the reels while the result stays hidden
+                    reels = (
+                        [t['name'] for t in random.choices(viable_attackers, k=12)] + [final_attacker],
+                        ['?'] + random.choices(valid_neighbors, k=10) + [final_defender]
+                    )
+                    header_placeholder.markdown(f"<div class='header-container'>{format_battle_header(final_attacker, final_defender, reels=reels)}</div>", unsafe_allow_html=True)
+                    time.sleep(ATTACKER_REEL_SECS + DEFENDER_REEL_SECS)
+
                     st.session_state.battle_log.append({"att": final_attacker, "def": final_defender, "winner": None})
                     st.session_state.last_header_content = format_battle_header(final_attacker, final_defender)
                     save_game_state()